@@ -7,16 +7,30 @@ Features
 1. Reads input text file and splits it into ~``chunk_size`` character chunks, ensuring
    we never break sentences in the middle (splits only after `.`, `?`, or `!`).
 2. Uses Selenium (Chrome) to open the RVC webpage, paste each chunk into the text
-   field, click the *Generate* button, and wait for the audio file (mp3/wav) to
-   download.
+   field, click the *Generate* button, and fetch the generated audio (mp3/wav)
+   straight from the page (falling back to the UI's download button). With
+   ``--parallel K`` up to K chunks are generated at once in separate tabs; this is
+   only safe if the RVC backend keeps each browser session's output separate.
 3. After all parts are generated, concatenates them in order into a single final
-   audio file (mp3 or wav) using *pydub*.
+   audio file (mp3 or wav). Parts are stream-copied with FFmpeg's concat demuxer
+   when possible; *pydub* re-encodes them otherwise (e.g. mp3 parts -> wav).
+4. With ``--cache NAME`` every generated part is kept in ``~/.cache/rvc_auto_tts/NAME``
+   keyed by its text, so unchanged chunks are not regenerated on later runs. The
+   key does not cover the voice model, pitch or TTS voice selected in the RVC UI:
+   use a different NAME per voice setup, or cached parts of the old voice will be
+   mixed into the new audio. The oldest parts are pruned once the whole cache
+   exceeds ``--cache-max-mb``.
+5. An interrupted run over the same text resumes with the parts it had already
+   finished (tracked per output file in ``rvc_manifest_<hash>.json``; disable with
+   ``--no-resume``). Parts whose chunk text was edited in between are regenerated.
+6. With ``--daemon`` the browser session stays open and JSON-line requests read
+   from stdin are voiced one after another (see ``serve_requests``).
 
 Prerequisites
 -------------
-- Python 3.8+
+- Python 3.9+
 - Google Chrome (or Chromium) installed
-- FFmpeg available on your ``PATH`` (required by *pydub*)
+- FFmpeg available on your ``PATH`` (used directly and by *pydub*)
 - Install Python deps:
     pip install selenium webdriver-manager pydub tqdm
 
@@ -37,14 +51,24 @@ adjustment to match your local UI.
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import json
 import os
+import queue
 import re
 import shutil
+import subprocess
 import sys
+import threading
 import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext, redirect_stdout
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, TextIO, Tuple
 import stat
 
 from pydub import AudioSegment
@@ -55,7 +79,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from tqdm import tqdm
 
@@ -73,6 +97,46 @@ HIDDEN_AUDIO_XPATH = '//*[@id="component-395"]/audio'
 
 URL = "http://127.0.0.1:6969/"
 
+# Previously generated parts, keyed by a hash of format + chunk text
+CACHE_DIR = Path.home() / ".cache" / "rvc_auto_tts"
+# Cached parts live in CACHE_DIR/<name>/ so each voice setup gets its own namespace
+_CACHE_NAME_RE = re.compile(r"\w[\w.-]*")
+# chromedriver path resolved by webdriver-manager on a previous run
+DRIVER_PATH_FILE = CACHE_DIR / "chromedriver_path.txt"
+# chromedriver error texts meaning the driver does not match the installed Chrome
+_DRIVER_VERSION_MISMATCH = ("only supports Chrome version", "This version of ChromeDriver")
+
+# Split points: whitespace that follows a sentence terminator.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Maps stray CR / tab characters to plain newline / space before splitting
+_WHITESPACE_TRANS = str.maketrans({"\r": "\n", "\t": " "})
+
+# Reads the main audio src, hidden audio src and download href in one
+# round-trip. Uses the DOM property (absolute URL) like get_attribute() does.
+_AUDIO_STATE_JS = """
+const read = (xpath, name) => {
+    const node = document.evaluate(xpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node ? (node[name] || node.getAttribute(name) || null) : null;
+};
+return [read(arguments[0], "src"), read(arguments[1], "src"), read(arguments[2], "href")];
+"""
+
+# Fetches arguments[0] inside the page and passes the body back as base64,
+# or null on any failure.
+_FETCH_AS_BASE64_JS = """
+const [url, done] = [arguments[0], arguments[arguments.length - 1]];
+fetch(url)
+    .then((r) => (r.ok ? r.blob() : Promise.reject(r.status)))
+    .then((blob) => {
+        const reader = new FileReader();
+        reader.onload = () => done(reader.result.split(",")[1] || null);
+        reader.onerror = () => done(null);
+        reader.readAsDataURL(blob);
+    })
+    .catch(() => done(null));
+"""
+
 # ---------------- Verbosity helpers ----------------
 VERBOSE = True  # Will be set in main() based on --quiet flag
 
@@ -83,239 +147,620 @@ def vprint(*args, **kwargs):
 # ---------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _word_chunk_re(chunk_size: int) -> re.Pattern:
+    """Regex matching up to *chunk_size* chars that end at a word boundary.
+
+    A word longer than *chunk_size* is cut into *chunk_size* pieces, as there
+    is no boundary to end at."""
+    return re.compile(r"\S.{0,%d}(?=\s|$)|\S{%d}" % (chunk_size - 1, chunk_size), re.DOTALL)
+
+
 def split_into_chunks(text: str, chunk_size: int = 1000) -> List[str]:
     """Split *text* into chunks not exceeding *chunk_size*, ending at sentence boundaries.
     Always includes remaining text in the last chunk, even if it's smaller than chunk_size."""
-    sentence_end_re = re.compile(r"(?<=[.!?])\s+")
-    sentences = sentence_end_re.split(text)
+    text = text.translate(_WHITESPACE_TRANS)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     chunks: List[str] = []
-    current_chunk = ""
+    # Sentences of the chunk being built; joined only on flush to avoid
+    # re-copying the growing string on every append.
+    current_buf: List[str] = []
+    current_len = 0
     for sent in sentences:
         sent = sent.strip()
         if not sent:
             continue
-        # +1 for potential space when joining
-        if len(current_chunk) + len(sent) + 1 > chunk_size:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = sent
-            else:
-                # Single sentence longer than chunk_size; split brutally
-                parts = [sent[i : i + chunk_size] for i in range(0, len(sent), chunk_size)]
-                chunks.extend(parts[:-1])
-                current_chunk = parts[-1]
+        if len(sent) > chunk_size:
+            # Single sentence longer than chunk_size; flush, then split between words
+            if current_buf:
+                chunks.append(" ".join(current_buf))
+            parts = [p.rstrip() for p in _word_chunk_re(chunk_size).findall(sent)]
+            chunks.extend(parts[:-1])
+            current_buf = [parts[-1]]
+            current_len = len(parts[-1])
+        # +1 for the space when joining with the previous sentence
+        elif current_len + len(sent) + (1 if current_buf else 0) > chunk_size:
+            chunks.append(" ".join(current_buf))
+            current_buf = [sent]
+            current_len = len(sent)
         else:
-            current_chunk += (" " if current_chunk else "") + sent
+            current_len += len(sent) + (1 if current_buf else 0)
+            current_buf.append(sent)
 
     # Всегда добавляем оставшийся текст, даже если он меньше chunk_size
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+    if current_buf:
+        chunks.append(" ".join(current_buf))
     # Если chunks пустой, но есть текст - добавляем весь текст как один чанк
     elif text.strip():
         chunks.append(text.strip())
     return chunks
 
 
-def setup_browser(download_dir: Path) -> webdriver.Chrome:
-    """Configure Chrome WebDriver to connect to existing Chrome instance."""
+@lru_cache(maxsize=None)
+def chromedriver_path(refresh: bool = False) -> str:
+    """Return the chromedriver path, remembered across runs in ``DRIVER_PATH_FILE``.
+
+    ``ChromeDriverManager().install()`` checks the latest driver version online
+    on every call, so it only runs when no remembered driver exists or when
+    *refresh* is requested (e.g. Chrome was updated and the old driver no
+    longer starts)."""
+    if not refresh:
+        try:
+            path = DRIVER_PATH_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            path = ""
+        if path and Path(path).is_file():
+            return path
+
+    path = ChromeDriverManager().install()
+    DRIVER_PATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+    DRIVER_PATH_FILE.write_text(path, encoding="utf-8")
+    return path
+
+
+def wait_rvc_ready(url: str = URL, timeout: float = 10):
+    """Poll *url* until the RVC web UI answers with HTTP 200."""
+    # The UI is local: never route the probe through http_proxy / system proxies
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    start = time.time()
+    while time.time() - start < timeout:
+        try:
+            with opener.open(url, timeout=0.5) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:  # includes urllib.error.URLError
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"RVC web UI is not reachable at {url}")
+
+
+def setup_browser() -> webdriver.Chrome:
+    """Configure Chrome WebDriver to connect to existing Chrome instance.
+
+    The download directory is set per part by :func:`download_via_button`."""
     chrome_options = Options()
     # Подключаемся к уже запущенному Chrome
     chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
 
-    # Настройки для скачивания файлов
-    prefs = {
-        "download.default_directory": str(download_dir),
-        "download.prompt_for_download": False,
-        "download.directory_upgrade": True,
-        "safebrowsing.enabled": True,
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-
     # Create a Service instance to avoid passing the driver path as positional arg
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    # Устанавливаем download directory через DevTools протокол
     try:
-        driver.execute_cdp_cmd("Page.setDownloadBehavior", {
-            "behavior": "allow",
-            "downloadPath": str(download_dir)
-        })
-        vprint(f"[INFO] Настроил директорию загрузки Chrome: {download_dir}")
-    except Exception as e:
-        vprint(f"[WARN] Не удалось установить download directory: {e}")
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+    except SessionNotCreatedException as e:
+        # Обновляем драйвер только при несовпадении версий; иначе (например, Chrome
+        # не слушает 127.0.0.1:9222) новый драйвер не поможет
+        if not any(marker in str(e) for marker in _DRIVER_VERSION_MISMATCH):
+            raise
+        vprint("[WARN] Сохранённый chromedriver не подходит к версии Chrome, обновляю его")
+        driver = webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=chrome_options)
     return driver
 
 
-def wait_for_new_download(download_dir: Path, known_files: set[str], timeout: int) -> Path:
-    """Wait until a new file appears in *download_dir* (not in *known_files*)."""
+def set_download_dir(driver: webdriver.Chrome, download_dir: Path):
+    """Point Chrome's downloads at *download_dir* via the DevTools protocol."""
+    behavior = {"behavior": "allow", "downloadPath": str(download_dir)}
+    try:
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", {**behavior, "eventsEnabled": True})
+    except WebDriverException:
+        # Older Chrome builds only support the per-page (deprecated) variant
+        driver.execute_cdp_cmd("Page.setDownloadBehavior", behavior)
+
+
+class GenerationStopped(Exception):
+    """Raised in worker threads once the run they belong to has been aborted."""
+
+
+def wait_for_new_download(download_dir: Path, timeout: int, stop: threading.Event | None = None) -> Path:
+    """Wait until a completed file appears in the initially empty *download_dir*."""
     start = time.time()
     while time.time() - start < timeout:
-        candidates = {f for f in os.listdir(download_dir) if not f.endswith(".crdownload")}
-        new_files = candidates - known_files
-        if new_files:
-            newest = max(new_files, key=lambda f: (download_dir / f).stat().st_mtime)
-            return download_dir / newest
+        if stop is not None and stop.is_set():
+            raise GenerationStopped
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".crdownload"):
+                    return Path(entry.path)
         time.sleep(0.5)
     raise TimeoutError("Download did not complete within allotted time")
 
 
-def generate_audio_chunks(chunks: List[str], fmt: str, max_wait: int) -> Path:
-    """Drive browser automation to generate audio files for each *chunks* and return folder path."""
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    download_dir = Path.cwd() / f"rvc_downloads_{ts}"
-    download_dir.mkdir(exist_ok=True)
+def read_audio_state(driver: webdriver.Chrome) -> List[str | None]:
+    """Return ``[main audio src, hidden audio src, download href]`` of the page."""
+    return driver.execute_script(
+        _AUDIO_STATE_JS, MAIN_AUDIO_XPATH, HIDDEN_AUDIO_XPATH, DOWNLOAD_ANCHOR_XPATH
+    )
+
+
+def chunk_key(chunk: str, fmt: str) -> str:
+    """Return the content hash identifying the audio of *chunk* in format *fmt*."""
+    return hashlib.blake2b(f"{fmt}|{chunk}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def chunk_cache_path(cache_dir: Path, chunk: str, fmt: str) -> Path:
+    """Return the cache location for the audio of *chunk* in format *fmt*."""
+    return cache_dir / f"{chunk_key(chunk, fmt)}.{fmt}"
+
+
+def prune_cache(cache_root: Path, max_bytes: int):
+    """Delete the least recently used cached parts until *cache_root* holds at most *max_bytes*."""
+    entries = []
+    for path in cache_root.glob("*/*"):
+        if path.suffix in (".mp3", ".wav") and path.is_file():
+            st = path.stat()
+            entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    """Return the resume manifest location for a run writing *output_path*.
 
-    driver = setup_browser(download_dir)
-    vprint("[INFO] Подключился к существующему Chrome. Убедитесь что RVC открыт на http://127.0.0.1:6969/")
+    Keyed by the output rather than the input text, so editing the text after
+    an interrupted run still finds (and reuses or cleans up) that run's parts."""
+    digest = hashlib.blake2b(str(output_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path.cwd() / f"rvc_manifest_{digest}.json"
 
+
+def load_manifest(path: Path) -> dict:
+    """Load the resume manifest at *path*; a missing or broken one counts as empty."""
     try:
-        for idx, chunk in enumerate(tqdm(chunks, desc="Generating", unit="chunk"), start=1):
-            # 1. Находим и заполняем поле ввода
-            textarea = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, TEXTAREA_XPATH))
-            )
-            # Проверяем что элемент видим и кликабелен
-            WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, TEXTAREA_XPATH))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", textarea)
-            # Используем JavaScript для установки значения textarea
-            driver.execute_script("arguments[0].value = '';", textarea)  # Очищаем
-            driver.execute_script("arguments[0].value = arguments[1];", textarea, chunk)  # Устанавливаем текст
-            # Триггерим событие input для активации обработчиков
-            driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", textarea)
-
-            # --- ШАГ 2. Подготовка данных для сравнения перед генерацией ---
-            # Фиксируем текущее состояние аудио и ссылки download
-            def get_attr_safe(xpath, attr):
-                try:
-                    return driver.find_element(By.XPATH, xpath).get_attribute(attr)
-                except Exception:
-                    return None
-
-            prev_src_main = get_attr_safe(MAIN_AUDIO_XPATH, "src")
-            prev_src_hidden = get_attr_safe(HIDDEN_AUDIO_XPATH, "src")
-            prev_href_download = get_attr_safe(DOWNLOAD_ANCHOR_XPATH, "href")
-
-            # 2. Нажимаем кнопку Generate
-            gen_btn = driver.find_element(By.XPATH, GENERATE_BTN_XPATH)
-            WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, GENERATE_BTN_XPATH))
-            )
-            driver.execute_script("arguments[0].scrollIntoView(true);", gen_btn)
-            gen_btn.click()
-
-            # --- ШАГ 3. Ожидаем готовности нового аудио (любое изменение) ---
-            vprint(f"[INFO] Жду генерации аудио для части {idx}...")
-
-            def new_audio_ready(_driver):
-                try:
-                    # Проверяем src у основного аудио
-                    cur_main = get_attr_safe(MAIN_AUDIO_XPATH, "src")
-                    if cur_main and cur_main != prev_src_main:
-                        return True
-
-                    # Проверяем src у скрытого аудио
-                    cur_hidden = get_attr_safe(HIDDEN_AUDIO_XPATH, "src")
-                    if cur_hidden and cur_hidden != prev_src_hidden:
-                        return True
-
-                    # Проверяем ссылку download у якоря
-                    cur_href = get_attr_safe(DOWNLOAD_ANCHOR_XPATH, "href")
-                    if cur_href and cur_href != prev_href_download:
-                        return True
-                except Exception:
-                    pass
-                return False
-
-            try:
-                WebDriverWait(driver, 300, poll_frequency=1.0).until(new_audio_ready)
-                vprint(f"[INFO] Аудио сгенерировано для части {idx}")
-            except TimeoutException:
-                raise RuntimeError(f"Audio generation timed out for chunk {idx}")
-
-            # 4. Ждём появления кнопки скачивания и кликаем
-            vprint(f"[INFO] Ищу кнопку скачивания для части {idx}...")
-            download_btn = WebDriverWait(driver, 60, poll_frequency=1.0).until(
-                EC.element_to_be_clickable((By.XPATH, DOWNLOAD_BTN_CLICK_XPATH))
-            )
-            vprint(f"[INFO] Кнопка скачивания найдена для части {idx}")
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def manifest_parts_dir(manifest: dict) -> Path | None:
+    """Return the parts folder named by *manifest* if it is safe to reuse or delete.
+
+    Only an existing ``rvc_downloads_*`` folder directly inside the current
+    directory qualifies; anything else (stale or hand-edited manifest) is ignored."""
+    raw = manifest.get("dir")
+    if not isinstance(raw, str):
+        return None
+    path = Path(raw)
+    if (
+        path.name.startswith("rvc_downloads_")
+        and path.parent.resolve() == Path.cwd().resolve()
+        and path.is_dir()
+        and not path.is_symlink()
+    ):
+        return path
+    return None
+
+
+def discard_manifest(path: Path):
+    """Delete the manifest at *path* together with the parts folder it names."""
+    parts_dir = manifest_parts_dir(load_manifest(path))
+    if parts_dir is not None:
+        remove_parts_dir(parts_dir)
+    path.unlink(missing_ok=True)
+
+
+def save_manifest(path: Path, manifest: dict):
+    """Write *manifest* to *path* atomically (temp file + ``os.replace``)."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class TabGate:
+    """Serialise Selenium calls made by worker threads sharing one driver.
+
+    A WebDriver session is not thread-safe and talks to one tab at a time, so
+    every call is made under ``lock`` after switching to the caller's tab.
+    ``downloads`` is held while a tab downloads its part, because all tabs
+    share Chrome's download behaviour setting."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.lock = threading.RLock()
+        self.downloads = threading.Lock()
+        self._active = driver.current_window_handle
+
+    @contextmanager
+    def tab(self, handle: str):
+        """Hold the driver lock with *handle* as the active tab."""
+        with self.lock:
+            if handle != self._active:
+                self.driver.switch_to.window(handle)
+                self._active = handle
+            yield self.driver
+
+    def wait(
+        self, handle: str, timeout: float, condition, poll_frequency: float = 0.5,
+        stop: threading.Event | None = None,
+    ):
+        """``WebDriverWait.until`` in tab *handle*, releasing the lock between polls.
+
+        Raises :class:`GenerationStopped` on the first poll after *stop* is set."""
+        def locked(_driver):
+            if stop is not None and stop.is_set():
+                raise GenerationStopped
+            with self.tab(handle) as d:
+                return condition(d)
+
+        return WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(locked)
+
+
+def open_tabs(driver: webdriver.Chrome, count: int) -> List[str]:
+    """Return handles of *count* RVC tabs: the current one plus newly opened ones."""
+    first = driver.current_window_handle
+    handles = [first]
+    for _ in range(count - 1):
+        driver.switch_to.new_window("tab")
+        driver.get(URL)
+        WebDriverWait(driver, 60).until(EC.presence_of_element_located((By.XPATH, TEXTAREA_XPATH)))
+        handles.append(driver.current_window_handle)
+    driver.switch_to.window(first)
+    if count > 1:
+        vprint(f"[INFO] Открыл {count - 1} дополнительных вкладок RVC")
+    return handles
+
+
+def close_tabs(driver: webdriver.Chrome, handles: List[str]):
+    """Close the tabs opened by :func:`open_tabs`, keeping the first one."""
+    if len(handles) < 2:
+        return
+    try:
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+    except WebDriverException as e:
+        vprint(f"[WARN] Не удалось закрыть дополнительные вкладки: {e}")
+
+
+def generate_chunk(
+    gate: TabGate, handle: str, stop: threading.Event, idx: int, chunk: str, download_dir: Path, fmt: str,
+    max_wait: int,
+) -> Tuple[Path, str]:
+    """Generate the audio for one *chunk* in tab *handle*; return the saved part path and its URL.
+
+    The audio is fetched by the page itself as soon as it is ready; Chrome's
+    download button is only used if that fails. Every wait gives up with
+    :class:`GenerationStopped` once *stop* is set."""
+    # 1. Находим и заполняем поле ввода (кликабельность подразумевает наличие)
+    textarea = gate.wait(
+        handle, 5, EC.element_to_be_clickable((By.XPATH, TEXTAREA_XPATH)), poll_frequency=0.1, stop=stop
+    )
+    with gate.tab(handle) as driver:
+        # Фокусируем поле и выделяем старый текст — insertText заменит выделение
+        driver.execute_script(
+            "arguments[0].scrollIntoView(true); arguments[0].focus(); arguments[0].select();", textarea
+        )
+        # Вставка через CDP вызывает родные события input, отдельный dispatch не нужен
+        driver.execute_cdp_cmd("Input.insertText", {"text": chunk})
+
+        # --- ШАГ 2. Подготовка данных для сравнения перед генерацией ---
+        # Фиксируем текущее состояние аудио и ссылки download
+        prev_state = read_audio_state(driver)
+
+    # 2. Нажимаем кнопку Generate
+    gen_btn = gate.wait(
+        handle, 5, EC.element_to_be_clickable((By.XPATH, GENERATE_BTN_XPATH)), poll_frequency=0.1, stop=stop
+    )
+    with gate.tab(handle) as driver:
+        driver.execute_script("arguments[0].scrollIntoView(true);", gen_btn)
+        gen_btn.click()
+
+    # --- ШАГ 3. Ожидаем готовности нового аудио (любое изменение) ---
+    vprint(f"[INFO] Жду генерации аудио для части {idx}...")
+
+    def new_audio_ready(_driver):
+        # Любое изменение src основного/скрытого аудио или ссылки download
+        try:
+            cur_state = read_audio_state(_driver)
+        except WebDriverException:
+            return False
+        changed = [cur if cur and cur != prev else None for cur, prev in zip(cur_state, prev_state)]
+        return changed if any(changed) else False
+
+    try:
+        changed = gate.wait(handle, 300, new_audio_ready, poll_frequency=0.25, stop=stop)
+        vprint(f"[INFO] Аудио сгенерировано для части {idx}")
+    except TimeoutException:
+        raise RuntimeError(f"Audio generation timed out for chunk {idx}")
+
+    # --- ШАГ 4. Забираем байты аудио прямо из страницы ---
+    part_path = download_dir / f"part_{idx:04d}.{fmt}"
+    # Предпочитаем ссылку download, затем скрытое и основное аудио
+    audio_url = changed[2] or changed[1] or changed[0]
+    try:
+        with gate.tab(handle) as driver:
+            b64 = driver.execute_async_script(_FETCH_AS_BASE64_JS, audio_url)
+    except WebDriverException as e:
+        vprint(f"[WARN] Ошибка получения аудио из страницы для части {idx}: {e}")
+        b64 = None
+    if b64:
+        part_path.write_bytes(base64.b64decode(b64))
+        vprint(f"[INFO] Аудио части {idx} получено из страницы")
+        return part_path, audio_url
+
+    vprint(f"[WARN] Не удалось получить аудио части {idx} из страницы, скачиваю через кнопку")
+    download_via_button(gate, handle, stop, idx, part_path, max_wait)
+    return part_path, audio_url
+
+
+def download_via_button(
+    gate: TabGate, handle: str, stop: threading.Event, idx: int, part_path: Path, max_wait: int
+):
+    """Download the current audio of tab *handle* with the UI's button into *part_path*."""
+    # Ждём появления кнопки скачивания и кликаем
+    vprint(f"[INFO] Ищу кнопку скачивания для части {idx}...")
+    download_btn = gate.wait(
+        handle, 60, EC.element_to_be_clickable((By.XPATH, DOWNLOAD_BTN_CLICK_XPATH)), poll_frequency=1.0,
+        stop=stop,
+    )
+    vprint(f"[INFO] Кнопка скачивания найдена для части {idx}")
+
+    # Папка загрузки задаётся на весь браузер, поэтому вкладки скачивают по одной
+    with gate.downloads:
+        # Каждая часть скачивается в свою пустую папку: не нужно сравнивать списки файлов
+        # dl_NNNN, not part_NNNN: a leftover folder must never look like an audio part
+        chunk_dir = part_path.with_name(part_path.stem.replace("part_", "dl_", 1))
+        # Остатки прерванной попытки иначе были бы приняты за новую загрузку
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+        chunk_dir.mkdir()
+
+        with gate.tab(handle) as driver:
+            set_download_dir(driver, chunk_dir)
             driver.execute_script("arguments[0].scrollIntoView(true);", download_btn)
+            download_btn.click()
+        vprint(f"[INFO] Кликнул по кнопке скачивания для части {idx}")
 
-            # Определяем текущие файлы перед скачиванием
-            before_files = {f for f in os.listdir(download_dir)}
+        # Wait for file to land in downloads
+        try:
+            vprint(f"[INFO] Жду загрузки файла для части {idx}...")
+            new_file = wait_for_new_download(chunk_dir, timeout=max_wait, stop=stop)
+            vprint(f"[INFO] Файл загружен: {new_file.name}")
+        except TimeoutError:
+            raise RuntimeError(f"Timed out waiting for download for chunk {idx}")
 
-            download_btn.click()
-            vprint(f"[INFO] Кликнул по кнопке скачивания для части {idx}")
-
-            # 4. Wait for file to land in downloads
-            try:
-                vprint(f"[INFO] Жду загрузки файла для части {idx}...")
-                new_file = wait_for_new_download(download_dir, before_files, timeout=max_wait)
-                vprint(f"[INFO] Файл загружен: {new_file.name}")
-            except TimeoutError:
-                raise RuntimeError(f"Timed out waiting for download for chunk {idx}")
-
-            # Rename to keep order
-            ordered_name = f"part_{idx:04d}.{fmt}"
-            vprint(f"[INFO] Переименовываю файл в {ordered_name}")
-            (download_dir / new_file.name).rename(download_dir / ordered_name)
-            vprint(f"[INFO] Часть {idx} завершена успешно")
+    # Move next to the other parts under the ordered name
+    vprint(f"[INFO] Переименовываю файл в {part_path.name}")
+    os.replace(new_file, part_path)
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+
+
+def _generate_in_free_tab(gate: TabGate, tabs: queue.Queue[str], *args) -> Tuple[Path, str]:
+    """Run :func:`generate_chunk` in whichever tab is free, then release it."""
+    handle = tabs.get()
+    try:
+        return generate_chunk(gate, handle, *args)
     finally:
-        driver.quit()
+        tabs.put(handle)
+
+
+def generate_audio_chunks(
+    gate: TabGate, handles: List[str], chunks: List[str], fmt: str, max_wait: int,
+    cache_dir: Path | None = None, manifest_path: Path | None = None,
+) -> Path:
+    """Drive browser automation to generate audio files for each *chunks* and return folder path.
+
+    Chunks already present in *cache_dir* are copied from there instead of
+    being generated again; pass ``None`` to disable the cache. One chunk is
+    generated at a time in each of the RVC tabs *handles*.
+
+    Finished parts are recorded in the JSON manifest at *manifest_path*. If it
+    names the folder of an interrupted earlier run, that folder is reused and
+    its parts are kept as long as their chunk text still matches."""
+    manifest = load_manifest(manifest_path) if manifest_path is not None else {}
+    prev_dir = manifest_parts_dir(manifest)
+    if prev_dir is not None:
+        download_dir = prev_dir
+        prev_parts = manifest.get("parts")
+        if not isinstance(prev_parts, dict):
+            prev_parts = {}
+        vprint(f"[INFO] Продолжаю прерванный запуск в {download_dir}")
+    else:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        download_dir = Path.cwd() / f"rvc_downloads_{ts}"
+        download_dir.mkdir(exist_ok=True)
+        prev_parts = {}
+
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    progress = tqdm(total=len(chunks), desc="Generating", unit="chunk")
+    done = {}  # str(idx) -> chunk key of parts present in download_dir
+    pending = []  # (idx, chunk, key, cache path) of chunks that must be generated
+    for idx, chunk in enumerate(chunks, start=1):
+        key = chunk_key(chunk, fmt)
+        part_path = download_dir / f"part_{idx:04d}.{fmt}"
+        cached = chunk_cache_path(cache_dir, chunk, fmt) if cache_dir is not None else None
+        if prev_parts.get(str(idx)) == key and part_path.is_file():
+            vprint(f"[INFO] Часть {idx} уже готова с прошлого запуска")
+        elif cached is not None and cached.is_file():
+            shutil.copyfile(cached, part_path)
+            os.utime(cached)  # mtime служит отметкой последнего использования для prune_cache
+            vprint(f"[INFO] Часть {idx} взята из кэша")
+        else:
+            pending.append((idx, chunk, key, cached))
+            continue
+        done[str(idx)] = key
+        progress.update()
+
+    # Части прошлого запуска, не подходящие к текущим чанкам, иначе попали бы в склейку
+    keep = {f"part_{int(idx):04d}.{fmt}" for idx in done}
+    for stale in [*download_dir.glob("part_*"), *download_dir.glob("dl_*")]:
+        if stale.name not in keep:
+            if stale.is_dir():
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                stale.unlink()
+
+    manifest = {"dir": str(download_dir), "parts": done}
+    if manifest_path is not None:
+        save_manifest(manifest_path, manifest)
+
+    try:
+        with gate.lock:
+            # Upper bound for fetching a generated part inside the page
+            gate.driver.set_script_timeout(max_wait)
+        tabs: queue.Queue[str] = queue.Queue()
+        for handle in handles:
+            tabs.put(handle)
+
+        stop = threading.Event()
+        url_keys = {}  # audio URL -> chunk key it was served for in this run
+        pool = ThreadPoolExecutor(max_workers=len(handles))
+        futures = {
+            pool.submit(_generate_in_free_tab, gate, tabs, stop, idx, chunk, download_dir, fmt, max_wait): (idx, key, cached)
+            for idx, chunk, key, cached in pending
+        }
+        try:
+            for future in as_completed(futures):
+                idx, key, cached = futures[future]
+                part, audio_url = future.result()
+                # Один и тот же файл для разных текстов: бэкенд RVC смешал вывод вкладок
+                if url_keys.setdefault(audio_url, key) != key:
+                    raise RuntimeError(
+                        f"RVC returned the same audio ({audio_url}) for different chunks; "
+                        "its output is not kept separate per tab, rerun with --parallel 1"
+                    )
+                done[str(idx)] = key
+                if manifest_path is not None:
+                    save_manifest(manifest_path, manifest)
+                if cached is not None:
+                    # Copy under a temp name first so an interrupted run never leaves a truncated entry
+                    tmp = cached.with_suffix(".tmp")
+                    shutil.copyfile(part, tmp)
+                    os.replace(tmp, cached)
+                vprint(f"[INFO] Часть {idx} завершена успешно")
+                progress.update()
+        except BaseException:
+            # Запущенные части прерываются на ближайшем опросе; дожидаемся их, чтобы
+            # следующий запрос (--daemon) не делил вкладки с оставшимися потоками
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown()
+    finally:
+        progress.close()
 
     return download_dir
 
 
-def concatenate_audio(parts_dir: Path, output_path: Path):
-    """Concatenate all audio files inside *parts_dir* (sorted) into *output_path*."""
-    files = sorted(parts_dir.glob("part_*"), key=lambda p: p.name)
-    if not files:
-        raise FileNotFoundError("No audio parts found to concatenate")
+def _concat_with_ffmpeg(files: List[Path], output_path: Path, list_path: Path) -> bool:
+    """Stream-copy *files* into *output_path* using FFmpeg's concat demuxer.
 
-    combined = AudioSegment.empty()
-    for f in files:
-        combined += AudioSegment.from_file(f)
+    Returns False if FFmpeg is not available or cannot copy the streams as-is,
+    so the caller can fall back to re-encoding."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return False
 
-    combined.export(output_path, format=output_path.suffix.lstrip("."))
-    print(f"[OK] Wrote final audio to {output_path.resolve()}")
+    # Single quotes are escaped as '\'' per the concat demuxer quoting rules
+    entries = (f.resolve().as_posix().replace("'", "'\\''") for f in files)
+    list_path.write_text("".join(f"file '{e}'\n" for e in entries), encoding="utf-8")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", str(list_path), "-c", "copy", str(output_path)],
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        vprint(f"[WARN] FFmpeg не смог склеить части без перекодирования: {e}")
+        return False
+    finally:
+        list_path.unlink(missing_ok=True)
+    return True
 
 
-def main(argv: List[str] | None = None):
-    parser = argparse.ArgumentParser(description="Automate RVC text-to-speech generation")
-    parser.add_argument("--input", default="input.txt", help="Path to input text file (default: input.txt in current dir)")
-    parser.add_argument("--out", required=True, help="Destination output audio file (mp3/wav)")
-    parser.add_argument("--format", choices=["mp3", "wav"], default="mp3", help="Audio format to download & merge")
-    parser.add_argument("--chunk-size", type=int, default=1000, help="Approximate characters per chunk (sentence aligned)")
-    parser.add_argument("--max-wait", type=int, default=120, help="Seconds to wait for each download")
-    parser.add_argument("--quiet", action="store_true", help="Suppress detailed logging")
+def sniff_audio_format(path: Path) -> str | None:
+    """Return ``"wav"`` or ``"mp3"`` from the file's leading bytes, or None if neither.
 
-    args = parser.parse_args(argv)
+    Parts are named after ``--format`` whatever RVC actually served, so the
+    suffix cannot be trusted when deciding whether bytes can be copied as-is."""
+    with open(path, "rb") as f:
+        head = f.read(12)
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    # ID3 tag, or a bare MPEG audio frame sync (11 set bits, layer != reserved)
+    if head[:3] == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0 and head[1] & 0x06):
+        return "mp3"
+    return None
 
-    # Set global verbosity flag so that helper vprint() knows whether to output
-    global VERBOSE
-    VERBOSE = not args.quiet
 
-    vprint("[INFO] Жду 3 секунды, переключитесь на окно RVC если нужно...")
-    time.sleep(3)
+def _decode_part(path: Path, fmt: str | None = None) -> Tuple[bytes, int, int, int]:
+    """Decode *path* to ``(pcm, frame_rate, channels, sample_width)`` (runs in a worker process)."""
+    seg = AudioSegment.from_file(path, format=fmt)
+    return seg.raw_data, seg.frame_rate, seg.channels, seg.sample_width
 
-    text_path = Path(args.input)
-    if not text_path.is_file():
-        parser.error(f"Input file {text_path} does not exist")
 
-    # Read and split input text
-    raw_text = text_path.read_text(encoding="utf-8")
-    chunks = split_into_chunks(raw_text, chunk_size=args.chunk_size)
-    vprint(f"[INFO] Split input into {len(chunks)} chunk(s)")
+def concatenate_audio(parts_dir: Path, output_path: Path):
+    """Concatenate all audio files inside *parts_dir* (sorted) into *output_path*."""
+    files = sorted((p for p in parts_dir.glob("part_*") if p.is_file()), key=lambda p: p.name)
+    if not files:
+        raise FileNotFoundError("No audio parts found to concatenate")
 
-    # Generate audio for each chunk via browser automation
-    parts_dir = generate_audio_chunks(chunks, fmt=args.format, max_wait=args.max_wait)
+    out_fmt = output_path.suffix.lstrip(".").lower()
+    # Copying is only valid if the bytes really are in the target format
+    formats = [sniff_audio_format(f) for f in files]
+    # A single part already in the target format is the final audio as-is
+    if len(files) == 1 and formats[0] == out_fmt:
+        shutil.copy2(files[0], output_path)
+        print(f"[OK] Wrote final audio to {output_path.resolve()}")
+        return
+
+    # Stream copy only works when the parts are already in the target format
+    if all(fmt == out_fmt for fmt in formats):
+        if _concat_with_ffmpeg(files, output_path, parts_dir / "concat_list.txt"):
+            print(f"[OK] Wrote final audio to {output_path.resolve()}")
+            return
+
+    # Re-encode: decode the parts on all cores, then encode the joined PCM once
+    workers = min(len(files), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            decoded = list(pool.map(_decode_part, files, formats))
+    else:
+        decoded = [_decode_part(f, fmt) for f, fmt in zip(files, formats)]
+
+    params = {d[1:] for d in decoded}
+    if len(params) == 1:
+        frame_rate, channels, sample_width = params.pop()
+        combined = AudioSegment(
+            data=b"".join(d[0] for d in decoded),
+            frame_rate=frame_rate, channels=channels, sample_width=sample_width,
+        )
+    else:
+        # Parts differ in rate/channels/width: let pydub convert them while joining
+        combined = sum(
+            (AudioSegment(data=pcm, frame_rate=fr, channels=ch, sample_width=sw) for pcm, fr, ch, sw in decoded),
+            AudioSegment.empty(),
+        )
 
-    # Concatenate parts in order
-    output_path = Path(args.out)
-    concatenate_audio(parts_dir, output_path)
+    combined.export(output_path, format=output_path.suffix.lstrip("."))
+    print(f"[OK] Wrote final audio to {output_path.resolve()}")
 
+
+def remove_parts_dir(parts_dir: Path):
+    """Delete *parts_dir*, retrying a few times (files may still be locked on Windows)."""
     # Надёжно очищаем временную папку с частями
     for attempt in range(3):
         try:
@@ -332,5 +777,144 @@ def main(argv: List[str] | None = None):
                 vprint(f"[WARN] Оставил временную папку {parts_dir}; удалите вручную")
 
 
+def process_text(
+    gate: TabGate, handles: List[str], text: str, output_path: Path, fmt: str = "mp3",
+    chunk_size: int = 1000, max_wait: int = 120, cache_dir: Path | None = None, resume: bool = True,
+    cache_max_bytes: int = 1024 * 2**20,
+):
+    """Voice *text* in the RVC tabs *handles* and write the merged audio to *output_path*.
+
+    Unless *resume* is False, an interrupted run for the same *output_path*
+    continues with the parts it had already finished."""
+    chunks = split_into_chunks(text, chunk_size=chunk_size)
+    vprint(f"[INFO] Split input into {len(chunks)} chunk(s)")
+
+    manifest_path = manifest_path_for(output_path)
+    if not resume:
+        discard_manifest(manifest_path)
+
+    # Generate audio for each chunk via browser automation
+    parts_dir = generate_audio_chunks(
+        gate, handles, chunks, fmt=fmt, max_wait=max_wait, cache_dir=cache_dir, manifest_path=manifest_path
+    )
+
+    if cache_dir is not None:
+        prune_cache(cache_dir.parent, cache_max_bytes)
+
+    # Concatenate parts in order
+    concatenate_audio(parts_dir, output_path)
+    manifest_path.unlink(missing_ok=True)
+    remove_parts_dir(parts_dir)
+
+
+def serve_requests(gate: TabGate, handles: List[str], args: argparse.Namespace, requests: TextIO, replies: TextIO):
+    """Process JSON-line requests from *requests* until EOF, reusing one browser session.
+
+    Each request looks like ``{"input": "text.txt", "out": "out.mp3", "format": "mp3"}``;
+    ``"text"`` may be given instead of ``"input"``, and ``format``, ``chunk_size``,
+    ``max_wait`` and ``cache`` default to the command-line values. For every request one
+    line ``{"ok": true, "out": ...}`` or ``{"ok": false, "error": ...}`` is
+    written to *replies*."""
+    for line in requests:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            text = req["text"] if "text" in req else Path(req["input"]).read_text(encoding="utf-8")
+            fmt = req.get("format", args.format)
+            if fmt not in ("mp3", "wav"):
+                raise ValueError(f"Unsupported format {fmt!r}")
+            cache_name = req.get("cache", args.cache)
+            if cache_name is not None and not _CACHE_NAME_RE.fullmatch(cache_name):
+                raise ValueError(f"Invalid cache name {cache_name!r}")
+            output_path = Path(req["out"])
+            process_text(
+                gate, handles, text, output_path, fmt=fmt,
+                chunk_size=int(req.get("chunk_size", args.chunk_size)),
+                max_wait=int(req.get("max_wait", args.max_wait)),
+                cache_dir=None if cache_name is None else CACHE_DIR / cache_name,
+                resume=not args.no_resume, cache_max_bytes=args.cache_max_mb * 2**20,
+            )
+            reply = {"ok": True, "out": str(output_path.resolve())}
+        except Exception as e:
+            vprint(f"[WARN] Запрос не выполнен: {e}")
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        print(json.dumps(reply, ensure_ascii=False), file=replies, flush=True)
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(description="Automate RVC text-to-speech generation")
+    parser.add_argument("--input", default="input.txt", help="Path to input text file (default: input.txt in current dir)")
+    parser.add_argument("--out", help="Destination output audio file (mp3/wav); required unless --daemon")
+    parser.add_argument("--format", choices=["mp3", "wav"], default="mp3", help="Audio format to download & merge")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Approximate characters per chunk (sentence aligned)")
+    parser.add_argument("--max-wait", type=int, default=120, help="Seconds to wait for each download")
+    parser.add_argument("--quiet", action="store_true", help="Suppress detailed logging")
+    parser.add_argument(
+        "--parallel", type=int, default=1,
+        help="Number of RVC browser tabs generating chunks concurrently. Only use >1 if your RVC backend keeps "
+             "each browser session's output separate; a UI that writes TTS output to a fixed file path would "
+             "hand one tab another tab's audio",
+    )
+    parser.add_argument(
+        "--cache", nargs="?", const="default", metavar="NAME",
+        help=f"Reuse parts generated on earlier runs, stored in {CACHE_DIR}/NAME (default NAME: default). "
+             "Parts are keyed by text only, so use a different NAME per RVC voice model/pitch/TTS voice",
+    )
+    parser.add_argument("--cache-max-mb", type=int, default=1024, help="Prune least recently used cached parts beyond this total size")
+    parser.add_argument("--no-resume", action="store_true", help="Start from scratch (deleting its parts) instead of continuing an interrupted run for the same --out")
+    parser.add_argument("--wait-ui", action="store_true", help="Pause 3 seconds before starting so you can switch to the RVC window")
+    parser.add_argument("--daemon", action="store_true", help="Keep the browser session open and serve JSON-line requests from stdin (see serve_requests)")
+
+    args = parser.parse_args(argv)
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    if args.cache is not None and not _CACHE_NAME_RE.fullmatch(args.cache):
+        parser.error("--cache NAME must start with a letter or digit and contain only letters, digits, '_', '.' and '-'")
+    if not args.daemon and not args.out:
+        parser.error("--out is required unless --daemon is used")
+
+    # Set global verbosity flag so that helper vprint() knows whether to output
+    global VERBOSE
+    VERBOSE = not args.quiet
+
+    raw_text = None
+    if not args.daemon:
+        text_path = Path(args.input)
+        if not text_path.is_file():
+            parser.error(f"Input file {text_path} does not exist")
+        # Read input text
+        raw_text = text_path.read_text(encoding="utf-8")
+
+    # В режиме демона stdout занят JSON-ответами, поэтому логи уходят в stderr
+    replies = sys.stdout
+    with redirect_stdout(sys.stderr) if args.daemon else nullcontext():
+        if args.wait_ui:
+            vprint("[INFO] Жду 3 секунды, переключитесь на окно RVC если нужно...")
+            time.sleep(3)
+        wait_rvc_ready(URL)
+
+        driver = setup_browser()
+        vprint("[INFO] Подключился к существующему Chrome. Убедитесь что RVC открыт на http://127.0.0.1:6969/")
+
+        handles = [driver.current_window_handle]
+        try:
+            handles = open_tabs(driver, args.parallel)
+            gate = TabGate(driver)
+            if args.daemon:
+                vprint("[INFO] Режим демона: жду JSON-запросы в stdin")
+                serve_requests(gate, handles, args, sys.stdin, replies)
+            else:
+                process_text(
+                    gate, handles, raw_text, Path(args.out), fmt=args.format,
+                    chunk_size=args.chunk_size, max_wait=args.max_wait,
+                    cache_dir=None if args.cache is None else CACHE_DIR / args.cache,
+                    resume=not args.no_resume, cache_max_bytes=args.cache_max_mb * 2**20,
+                )
+        finally:
+            close_tabs(driver, handles)
+            driver.quit()
+
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
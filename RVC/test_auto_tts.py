@@ -0,0 +1,165 @@
+"""Checks for the pure text helpers of auto_tts.py.
+
+Run with ``python -m pytest RVC``. The module imports Selenium, pydub etc. at
+top level, so the checks are skipped when those are not installed.
+"""
+import os
+import random
+import threading
+import types
+
+import pytest
+
+auto_tts = pytest.importorskip("auto_tts")
+
+
+def _non_space(text: str) -> str:
+    return "".join(text.split())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 12, 20, 50])
+def test_split_into_chunks_respects_size_and_keeps_text(chunk_size):
+    rng = random.Random(chunk_size)
+    for _ in range(300):
+        words = ["".join(rng.choice("ab") for _ in range(rng.randint(1, 15))) for _ in range(rng.randint(1, 30))]
+        text = " ".join(w + rng.choice(["", ".", "!", "  ", "\n", "\r\n", "\t"]) for w in words)
+
+        chunks = auto_tts.split_into_chunks(text, chunk_size)
+
+        assert all(0 < len(c) <= chunk_size for c in chunks), chunks
+        assert _non_space("".join(chunks)) == _non_space(text)
+
+
+def test_long_sentence_after_short_one_is_split():
+    chunks = auto_tts.split_into_chunks("Short one. " + "word " * 30 + "end.", 20)
+
+    assert chunks[0] == "Short one."
+    assert max(len(c) for c in chunks) <= 20
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", "wav"),
+        (b"ID3\x04\x00\x00\x00\x00\x00\x00", "mp3"),
+        (b"\xff\xfb\x90\x64\x00\x00", "mp3"),
+        (b"\xff\xf1\x50\x80\x00\x1f", None),  # AAC ADTS, not MPEG audio
+        (b"OggS\x00\x02", None),
+        (b"", None),
+    ],
+)
+def test_sniff_audio_format_ignores_suffix(tmp_path, head, expected):
+    # Named after --format, not after the bytes RVC actually served
+    part = tmp_path / "part_0001.mp3"
+    part.write_bytes(head)
+
+    assert auto_tts.sniff_audio_format(part) == expected
+
+
+class _FakeTqdm:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def update(self, n=1):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_run(tmp_path, monkeypatch):
+    """Run generate_audio_chunks in *tmp_path* with a fake worker instead of a browser.
+
+    Returns ``run(chunks, fail_at=None) -> download_dir``; ``run.generated`` lists the
+    chunk indexes the fake worker was asked to produce."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(auto_tts, "tqdm", _FakeTqdm)
+    monkeypatch.setattr(auto_tts, "VERBOSE", False)
+    gate = types.SimpleNamespace(
+        lock=threading.RLock(), driver=types.SimpleNamespace(set_script_timeout=lambda timeout: None)
+    )
+    manifest_path = tmp_path / "rvc_manifest_test.json"
+
+    def fake_worker(gate, tabs, stop, idx, chunk, download_dir, fmt, max_wait):
+        if idx == run.fail_at:
+            raise RuntimeError(f"chunk {idx} failed")
+        run.generated.append(idx)
+        part = download_dir / f"part_{idx:04d}.{fmt}"
+        part.write_text(chunk)
+        return part, f"blob:{idx}:{chunk}"
+
+    monkeypatch.setattr(auto_tts, "_generate_in_free_tab", fake_worker)
+
+    def run(chunks, fail_at=None, cache_dir=None):
+        run.generated = []
+        run.fail_at = fail_at
+        return auto_tts.generate_audio_chunks(
+            gate, ["tab"], chunks, "mp3", 5, cache_dir=cache_dir, manifest_path=manifest_path
+        )
+
+    run.manifest_path = manifest_path
+    return run
+
+
+def test_resume_reuses_folder_of_interrupted_run(fake_run):
+    with pytest.raises(RuntimeError):
+        fake_run(["a.", "b.", "c.", "d."], fail_at=3)
+    first_dir = auto_tts.manifest_parts_dir(auto_tts.load_manifest(fake_run.manifest_path))
+    assert first_dir is not None
+
+    download_dir = fake_run(["a.", "b.", "c.", "d."])
+
+    assert download_dir == first_dir
+    assert 1 not in fake_run.generated and 2 not in fake_run.generated
+    assert 3 in fake_run.generated
+    assert sorted(p.name for p in download_dir.iterdir()) == [f"part_000{i}.mp3" for i in range(1, 5)]
+
+
+def test_resume_regenerates_edited_chunks_and_drops_stale_parts(fake_run):
+    download_dir = fake_run(["a.", "b.", "c.", "d."])
+    (download_dir / "dl_0009").mkdir()
+    (download_dir / "part_0007").mkdir()
+
+    assert fake_run(["a.", "x."]) == download_dir
+
+    assert fake_run.generated == [2]
+    assert (download_dir / "part_0002.mp3").read_text() == "x."
+    assert sorted(p.name for p in download_dir.iterdir()) == ["part_0001.mp3", "part_0002.mp3"]
+
+
+def test_discard_manifest_removes_its_folder(fake_run):
+    download_dir = fake_run(["a.", "b."])
+
+    auto_tts.discard_manifest(fake_run.manifest_path)
+
+    assert not download_dir.exists()
+    assert not fake_run.manifest_path.exists()
+
+
+def test_manifest_folder_outside_cwd_is_ignored(fake_run, tmp_path):
+    outside = tmp_path / "elsewhere" / "rvc_downloads_x"
+    outside.mkdir(parents=True)
+    (outside / "part_0001.mp3").write_text("keep")
+    auto_tts.save_manifest(fake_run.manifest_path, {"dir": str(outside), "parts": {}})
+
+    auto_tts.discard_manifest(fake_run.manifest_path)
+    download_dir = fake_run(["a."])
+
+    assert (outside / "part_0001.mp3").read_text() == "keep"
+    assert download_dir != outside
+
+
+def test_prune_cache_evicts_least_recently_used(tmp_path):
+    voice = tmp_path / "voice"
+    voice.mkdir()
+    (tmp_path / "chromedriver_path.txt").write_text("x" * 5000)
+    for i in range(5):
+        part = voice / f"{i}.mp3"
+        part.write_bytes(b"x" * 100)
+        os.utime(part, (i, i))
+
+    auto_tts.prune_cache(tmp_path, 250)
+
+    assert sorted(p.name for p in voice.iterdir()) == ["3.mp3", "4.mp3"]
+    assert (tmp_path / "chromedriver_path.txt").exists()